@@ -13,7 +13,9 @@ For the user:
 
 import tkinter as tk
 from tkinter import ttk, simpledialog
-from PIL import ImageGrab
+from PIL import Image, ImageDraw
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import os  # Used for file paths and folder creation
 
 
@@ -21,23 +23,50 @@ CANVAS_WIDTH = 800
 CANVAS_HEIGHT = 500
 DEFAULT_COLOR = "#000000"
 DEFAULT_BRUSH_SIZE = 5
+PNG_COMPRESS_LEVEL = 1  # fast zlib level; drawings are small, saving speed matters more than file size
+SAVE_SUPERSAMPLE = 2  # strokes are drawn this many times larger, then scaled down for smooth edges
 
-# Global variables
-SAVE_COUNTER = 0
-LAST_SAVED_IMAGE = None
-LAST_SAVED_NAME = None
+class SaveState:
+    """
+    Remembers what was saved last, so other modules can ask for it.
+    """
+    def __init__(self):
+        self.counter = 0
+        self.image_path = None
+        self.name = None
+        self.future = None  # pending PNG write, if any
+
+
+SAVE_STATE = SaveState()
+
+# PNG encoding runs here so the window can close without waiting for it
+_save_executor = ThreadPoolExecutor(max_workers=1)
 
 def get_drawing_image():
     """
     For other modules: return the file path of the last drawn image.
+    Waits for the file to finish writing if it is still being saved.
+    Returns None if saving failed.
     """
-    return LAST_SAVED_IMAGE
+    if SAVE_STATE.future is not None:
+        try:
+            SAVE_STATE.future.result()
+        except Exception as e:  # e.g. no permission or disk full
+            print(f"Could not save drawing to {SAVE_STATE.image_path}: {e}")
+            SAVE_STATE.image_path = None
+        SAVE_STATE.future = None
+    return SAVE_STATE.image_path
 
 def get_drawing_name():
     """
     For other moddules: return the last fish name entered by the user.
     """
-    return LAST_SAVED_NAME
+    return SAVE_STATE.name
+
+def _write_png(img, file_path):
+    """Write the image to disk (runs on the save thread)."""
+    img.save(file_path, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    print(f"Saved drawing to {file_path}")
 
 class DrawingInterface:
     def __init__(self, root, save_folder="fish_drawings"):
@@ -49,12 +78,14 @@ class DrawingInterface:
         # Current draw state
         self.current_color = DEFAULT_COLOR
         self.brush_size = DEFAULT_BRUSH_SIZE
-        self.last_x = None
-        self.last_y = None
 
-        # List to store strokes for undo
+        # List to store strokes for undo: one canvas line id per stroke
         self.strokes = []
-        self.current_stroke = []
+        # Same strokes as (points, color, width), used when saving
+        self.stroke_paths = []
+        # Stroke being drawn: its line id and flat [x0, y0, x1, y1, ...] points
+        self.current_line = None
+        self.current_points = []
 
         # Main frame
         main_frame = tk.Frame(root, bg="#f0f4ff")
@@ -119,48 +150,83 @@ class DrawingInterface:
 
     def on_button_press(self, event):
         """ Mouse press on the canvas and a new stroke will start at this point."""
-        self.last_x = event.x
-        self.last_y = event.y
-        self.current_stroke = []
+        x, y = event.x, event.y
+        # One canvas item per stroke; mouse moves extend it instead of adding items
+        self.current_points = [x, y]
+        self.current_line = self.canvas.create_line(
+            x, y, x, y,
+            width=self.brush_size, fill=self.current_color,
+            capstyle=tk.ROUND, joinstyle=tk.ROUND
+        )
 
     def on_move_press(self, event):
-        """ Mouse moved while button is pressed. Draw a line."""
-        x, y = event.x, event.y
-        if self.last_x is not None and self.last_y is not None:
-            line_id = self.canvas.create_line(
-                self.last_x, self.last_y, x, y,
-                width=self.brush_size, fill=self.current_color,
-                capstyle=tk.ROUND, smooth=True
-            )
-            self.current_stroke.append(line_id)
-        self.last_x = x
-        self.last_y = y
+        """ Mouse moved while button is pressed. Extend the current line."""
+        if self.current_line is None:
+            return
+        self.current_points += (event.x, event.y)
+        self.canvas.coords(self.current_line, *self.current_points)
 
     def on_button_release(self, event):
         """Mouse released. Finish the current stroke."""
-        self.last_x = None
-        self.last_y = None
-        if self.current_stroke:
-            self.strokes.append(self.current_stroke)
-            self.current_stroke = []
+        if self.current_line is None:
+            return
+        if len(self.current_points) > 2:
+            self.strokes.append(self.current_line)
+            self.stroke_paths.append((self.current_points, self.current_color, self.brush_size))
+        else:
+            self.canvas.delete(self.current_line)  # a click without moving draws nothing
+        self.current_line = None
+        self.current_points = []
 
     def clear_canvas(self):
         """Clear the canvas and reset undo history."""
         self.canvas.delete("all")
         self.strokes = []
+        self.stroke_paths = []
 
     def undo_last_stroke(self):
         """ undo the last stroke"""
         if not self.strokes:
             return
-        last_stroke = self.strokes.pop()
-        for line_id in last_stroke:
-            self.canvas.delete(line_id)
+        self.canvas.delete(self.strokes.pop())
+        self.stroke_paths.pop()
 
     # Saving
-    def save_canvas(self):
-        global SAVE_COUNTER, LAST_SAVED_IMAGE, LAST_SAVED_NAME
+    def render_strokes(self):
+        """
+        Draw the saved strokes into a new transparent image.
+        This does not read the screen, so it works even if the window is covered.
+        Strokes are drawn SAVE_SUPERSAMPLE times larger and scaled down for smooth
+        edges. Pillow scales RGBA images with premultiplied alpha, so the edge
+        pixels keep the stroke color. Transparent pixels are left white (alpha 0)
+        for tools that drop alpha. The fish tank scales with premultiplied alpha
+        too, so that hidden white does not show up as a halo there.
+        """
+        k = SAVE_SUPERSAMPLE
+        img = Image.new("RGBA", (CANVAS_WIDTH * k, CANVAS_HEIGHT * k), (255, 255, 255, 0))
+        draw = ImageDraw.Draw(img)
+        for points, color, width in self.stroke_paths:
+            points = [p * k for p in points]
+            width = max(1, round(width * k))
+            r = width / 2
+            draw.line(points, fill=color, width=width, joint="curve")
+            # round caps, like capstyle=tk.ROUND on the canvas
+            for x, y in (points[:2], points[-2:]):
+                draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
+        if k > 1:
+            img = img.resize((CANVAS_WIDTH, CANVAS_HEIGHT), Image.Resampling.BOX)
+            # The premultiplied resize leaves transparent pixels as (0,0,0,0); put the
+            # white background back so convert("RGB") (e.g. in the classifier) still sees white
+            arr = np.array(img)
+            arr[arr[..., 3] == 0, :3] = 255
+            img = Image.fromarray(arr)
+        return img
 
+    def save_canvas(self):
+        """
+        Ask for a fish name and start saving the drawing.
+        Returns a future that finishes when the PNG is written.
+        """
         # Ask user for fish name
         fish_name_input = simpledialog.askstring(
             "Fish Name",
@@ -168,37 +234,26 @@ class DrawingInterface:
             parent=self.root
         )
         if not fish_name_input:
-            fish_name_input = f"fish_{SAVE_COUNTER+1}"
+            fish_name_input = f"fish_{SAVE_STATE.counter+1}"
 
         # Make filename safe
         safe_name = "".join([c if c.isalnum() else "_" for c in fish_name_input])
-        LAST_SAVED_NAME = fish_name_input
-
-        self.root.update()  # Make sure the drawing is visible
-
-        # canvas position and size
-        x = self.canvas.winfo_rootx()
-        y = self.canvas.winfo_rooty()
-        w = self.canvas.winfo_width()
-        h = self.canvas.winfo_height()
+        SAVE_STATE.name = fish_name_input
 
-        # Capture the canvas
-        img = ImageGrab.grab(bbox=(x+1, y+1, x+w-1, y+h-1)).convert("RGBA")
-        new_data = [(255,255,255,0) if r>250 and g>250 and b>250 else (r,g,b,a) for r,g,b,a in img.getdata()]
-        img.putdata(new_data)
+        img = self.render_strokes()
 
-        SAVE_COUNTER += 1
+        SAVE_STATE.counter += 1
         file_path = os.path.abspath(os.path.join(self.save_folder, f"{safe_name}.png"))
-        img.save(file_path, "PNG")
-        LAST_SAVED_IMAGE = file_path
-        print(f"Saved drawing to {file_path}")
+        SAVE_STATE.image_path = file_path
+        SAVE_STATE.future = _save_executor.submit(_write_png, img, file_path)
+        return SAVE_STATE.future
 
     def save_and_close(self):
-        self.save_canvas()
-        self.root.destroy()
+        future = self.save_canvas()
+        self.root.destroy()  # don't wait for the PNG; get_drawing_image() does
+        return future
 
 def main(save_folder="fish_drawings"): # Allows the module to be used for testing and as an imported module
-    os.makedirs(save_folder, exist_ok=True)
     root = tk.Tk()
     app = DrawingInterface(root, save_folder)
     root.mainloop()
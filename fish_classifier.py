@@ -16,6 +16,7 @@ The classifier performs the following steps:
       - the confidence score from the model
 """
 
+import tensorflow as tf
 from tensorflow.keras.models import load_model
 from PIL import Image, ImageOps 
 import numpy as np
@@ -37,6 +38,9 @@ def clean_label(raw: str) -> str:
 
 
 class FishClassifier:
+    # Hidden Tk root shared by all popups, created only if no other root exists
+    _tk_root = None
+
     def __init__(self,
                  model_path="converted_keras/keras_model.h5",
                  label_path="converted_keras/labels.txt",
@@ -50,6 +54,11 @@ class FishClassifier:
         # Load model
         self.model = load_model(model_path, compile=False)
 
+        # Reused input buffer and a traced model call, so each prediction
+        # skips the allocation and the model.predict() wrapper overhead
+        self._buf = np.empty((1, 224, 224, 3), dtype=np.float32)
+        self._infer = tf.function(self.model)
+
         # Load and clean labels
         with open(label_path, "r") as f:
             self.class_names = [clean_label(line) for line in f.readlines()]
@@ -62,39 +71,42 @@ class FishClassifier:
 
 
 
-    def is_fish(self, image_path: str, show_popup = False):
+    def is_fish(self, image_path: str, show_popup = False, parent=None):
         """
         Classify an image as Fish / Not Fish.
+        parent: optional Tk window to attach the popup to
         Returns:
                 (is_fish_flag: bool, confidence: float)
         """
 
-        data = np.ndarray(shape=(1, 224, 224, 3), dtype=np.float32)
-
         # Load and preprocess
         image = Image.open(image_path).convert("RGB")
         image = ImageOps.fit(image, (224, 224), Image.Resampling.LANCZOS)
         image_array = np.asarray(image)
 
-        # Normalize to [-1, 1]
-        normalized_image = (image_array.astype(np.float32) / 127.5) - 1.0
-        data[0] = normalized_image
+        # Normalize to [-1, 1], written straight into the input buffer
+        np.divide(image_array, 127.5, out=self._buf[0], casting="unsafe")
+        self._buf[0] -= 1.0
 
-        prediction = self.model.predict(data)
+        prediction = self._infer(self._buf).numpy()
         confidence = float(prediction[0][self.fish_index])
 
         is_fish_flag = confidence >= self.threshold
 
         # Show popup: Probability of fish if show_popup is True
         if show_popup:
-            root = tk.Tk()
-            root.withdraw()  # hide empty root window
+            # Reuse an existing Tk root instead of starting a new Tcl interpreter
+            if parent is None and tk._default_root is None:
+                if FishClassifier._tk_root is None:
+                    FishClassifier._tk_root = tk.Tk()
+                    FishClassifier._tk_root.withdraw()  # hide empty root window
+                parent = FishClassifier._tk_root
 
             msg = (
                 f"Fish Probability: {confidence:.3f}\n\n"
                 f"{'✔ This is a fish!' if is_fish_flag else '✘ Not a fish.'}"
             )
-            messagebox.showinfo("AI Classification Result", msg)
+            messagebox.showinfo("AI Classification Result", msg, parent=parent)
 
         return is_fish_flag, confidence
 
@@ -22,11 +22,17 @@ the 'fish_drawings', 'food_images', and 'tank' folders respectively.
 # -------------------- Imports --------------------
 import pygame
 import random
+from math import hypot
+import numpy as np
 import glob
 import os
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import messagebox
-from drawing_interface import get_drawing_image, LAST_SAVED_NAME
+try:
+    from scipy.spatial import cKDTree  # optional: faster closest-food search with lots of fish
+except ImportError:
+    cKDTree = None
 
 # -------------------- Constants --------------------
 FISH_SPEED_SCALE = 0.5  # for other software engineers: scales all fish speeds
@@ -34,15 +40,40 @@ BUBBLE_SPEED_RANGE = (0.6, 1.6)  # for other software engineers: min/max speed o
 BUBBLE_DRIFT_RANGE = (-0.4, 0.4)
 BUBBLE_RADIUS_RANGE = (3, 8)
 FOOD_DISPLAY_SIZE = (50, 50)
+BG_CACHE_SIZE = 3  # for other software engineers: how many decoded backgrounds stay in memory
 FADE_SPEED = 8  # for other software engineers: controls how fast food fades after eaten
+# for other software engineers: with at least this many fish, one batched KD-tree query beats a
+# NumPy scan per fish (measured crossover ~14 fish for 17-256 foods, scipy 1.17)
+KDTREE_MIN_FISH = 16
+CHASE_REAIM_DIST = 20  # for other software engineers: pixels a fish swims before re-aiming at the same food
+
+# for other software engineers: decoded + scaled fish images, keyed by (absolute path, scale)
+_FISH_IMG_CACHE = {}
 
 # -------------------- Classes --------------------
 class Fish:
     """Represents a fish in the aquarium. # for client"""
     def __init__(self, img_path, w, h, scale=(120, 80), speed=2):
-        self.image = pygame.transform.scale(
-            pygame.image.load(img_path).convert_alpha(), scale
-        )
+        # for other software engineers: fish with the same image share one surface;
+        # flipping in _check_bounds makes a new surface, so the shared one is never changed.
+        # The image is scaled with premultiplied alpha (and blitted that way in draw), so the
+        # colour hidden under transparent pixels can't leak into the smoothed edges.
+        # Flipped copies stay premultiplied too.
+        key = (os.path.abspath(img_path), tuple(scale))
+        image = _FISH_IMG_CACHE.get(key)
+        if image is None:
+            image = pygame.transform.smoothscale(
+                pygame.image.load(img_path).convert_alpha().premul_alpha(), scale
+            )
+            _FISH_IMG_CACHE[key] = image
+        self.image = image
+        # for other software engineers: image size never changes (flip keeps it), so cache it
+        self.iw = self.image.get_width()
+        self.ih = self.image.get_height()
+        self.hw = self.iw // 2
+        self.hh = self.ih // 2
+        self.eat_radius = min(self.iw, self.ih) * 0.35
+        self._eat_radius_sq = self.eat_radius ** 2
         self.w, self.h = w, h
         self.speed = speed * FISH_SPEED_SCALE
         self.x = random.randint(50, w - 50)
@@ -50,43 +81,61 @@ class Fish:
         self.dx = random.choice([-self.speed, self.speed])
         self.dy = random.choice([-self.speed, self.speed])
         self.change_dir_counter = 0
+        # for other software engineers: cached chase direction, see update()
+        self._target = None
+        self._aim_x = self._aim_y = 0.0
+        self._vx = self._vy = 0.0
 
     def _check_bounds(self):
         # for other software engineers: flip fish image horizontally when bouncing
-        if self.x < 0 or self.x > self.w - self.image.get_width():
+        if self.x < 0 or self.x > self.w - self.iw:
             self.dx = -self.dx
             self.image = pygame.transform.flip(self.image, True, False)
-            self.x = max(0, min(self.x, self.w - self.image.get_width()))
+            self.x = max(0, min(self.x, self.w - self.iw))
             
-        if self.y < 0 or self.y > self.h - self.image.get_height():
+        if self.y < 0 or self.y > self.h - self.ih:
             self.dy = -self.dy
-            self.y = max(0, min(self.y, self.h - self.image.get_height()))
+            self.y = max(0, min(self.y, self.h - self.ih))
 
-    def update(self, food_list):
+    def update(self, food_list, food_xy, nearest=None):
         # for client: fish will swim toward food if available, else random movement
-        cx = self.x + self.image.get_width() // 2
-        cy = self.y + self.image.get_height() // 2
+        # for other software engineers: food_xy holds food centers, one row per item of food_list;
+        # nearest is an optional precomputed (distance, index) of the closest food
+        cx = self.x + self.hw
+        cy = self.y + self.hh
 
         if food_list:
-            closest = min(
-                food_list,
-                key=lambda f: (f.x - cx) ** 2 + (f.y - cy) ** 2
-            )
-            fx = closest.x + closest.surface.get_width() // 2
-            fy = closest.y + closest.surface.get_height() // 2
-            dx = fx - cx
-            dy = fy - cy
-            dist = max((dx ** 2 + dy ** 2) ** 0.5, 0.01)
-
-            eat_radius = min(self.image.get_width(), self.image.get_height()) * 0.35
-            if dist < eat_radius:
+            if nearest is not None:
+                dist, idx = nearest
+                closest_d2 = dist * dist
+            else:
+                d2 = (food_xy[:, 0] - cx) ** 2 + (food_xy[:, 1] - cy) ** 2
+                idx = d2.argmin()
+                closest_d2 = d2[idx]
+            idx = int(idx)
+            closest = food_list[idx]
+
+            if closest_d2 < self._eat_radius_sq:
                 closest.start_fade()  # for client: fish eats the food
                 return
 
+            # for other software engineers: re-aim only when the target changes
+            # or the fish has swum CHASE_REAIM_DIST since the last aim
+            if (closest is not self._target
+                    or (cx - self._aim_x) ** 2 + (cy - self._aim_y) ** 2 > CHASE_REAIM_DIST ** 2):
+                dx = float(food_xy[idx, 0]) - cx
+                dy = float(food_xy[idx, 1]) - cy
+                dist = hypot(dx, dy) or 0.01
+                self._vx = self.speed * dx / dist
+                self._vy = self.speed * dy / dist
+                self._target = closest
+                self._aim_x, self._aim_y = cx, cy
+
             # for other software engineers: move fish toward food
-            self.dx = self.speed * dx / dist
-            self.dy = self.speed * dy / dist
+            self.dx = self._vx
+            self.dy = self._vy
         else:
+            self._target = None
             self.change_dir_counter += 1
             if self.change_dir_counter > 120:
                 # for other software engineers: random swim direction
@@ -100,27 +149,17 @@ class Fish:
 
     def draw(self, screen):
         # for client: draws fish on the screen
-        screen.blit(self.image, (self.x, self.y))
+        screen.blit(self.image, (self.x, self.y), special_flags=pygame.BLEND_PREMULTIPLIED)
 
 
-class Bubble:
-    """Rising bubble animation. # for client"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.radius = random.randint(*BUBBLE_RADIUS_RANGE)
-        self.speed = random.uniform(*BUBBLE_SPEED_RANGE)
-        self.drift = random.uniform(*BUBBLE_DRIFT_RANGE)
-
-    def update(self, screen_width, screen_height):
-        # for other software engineers: moves bubble upwards with horizontal drift
-        self.y -= self.speed
-        self.x += self.drift
-        return self.y + self.radius > 0 and -50 < self.x < screen_width + 50
-
-    def draw(self, screen):
-        # for client: draws bubble as a circle
-        pygame.draw.circle(screen, (230, 240, 255), (int(self.x), int(self.y)), self.radius, 1)
+def make_bubble_sprites():
+    """Pre-render one bubble outline per radius so drawing is just a blit. # for other software engineers"""
+    sprites = {}
+    for r in range(BUBBLE_RADIUS_RANGE[0], BUBBLE_RADIUS_RANGE[1] + 1):
+        surf = pygame.Surface((2 * r + 2, 2 * r + 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (230, 240, 255), (r, r), r, 1)
+        sprites[r] = surf
+    return sprites
 
 
 class Food:
@@ -128,6 +167,8 @@ class Food:
     def __init__(self, pos, surface):
         self.x, self.y = pos
         self.surface = surface.copy()
+        self.hw = self.surface.get_width() // 2
+        self.hh = self.surface.get_height() // 2
         self.alpha = 255
         self.fading = False
 
@@ -140,10 +181,10 @@ class Food:
         return self.alpha > 0
 
     def draw(self, screen):
-        temp_surface = self.surface.copy()
+        # for other software engineers: each Food owns its surface copy, so set alpha on it directly
         if self.fading:
-            temp_surface.set_alpha(max(self.alpha, 0))
-        screen.blit(temp_surface, (self.x, self.y))
+            self.surface.set_alpha(max(self.alpha, 0))
+        screen.blit(self.surface, (self.x, self.y))
 
 
 # -------------------- Fish Speed GUI --------------------
@@ -192,16 +233,13 @@ class AquariumGame:
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Fish Aquarium")
 
-        # Load backgrounds
-        self.backgrounds = []
+        # Find backgrounds; they are decoded lazily in _get_background
+        self._bg_paths = []
         for ext in ["*.jpg", "*.png"]:
-            self.backgrounds.extend(
+            self._bg_paths.extend(
                 sorted(glob.glob(os.path.join(bg_folder, ext)))
             )
-        self.backgrounds = [
-            pygame.transform.scale(pygame.image.load(p).convert(), (width, height))
-            for p in self.backgrounds
-        ]
+        self._bg_cache = OrderedDict()  # index -> scaled surface, least recently used first
         self.current_bg_index = 0
 
         # Load food images
@@ -213,7 +251,15 @@ class AquariumGame:
 
         self.fish_list = []
         self.food_list = []
-        self.bubbles = []
+        self._food_xy = np.empty((0, 2), dtype=np.float32)  # food centers, rebuilt every frame
+        # for other software engineers: bubbles are stored as parallel arrays (one entry per bubble)
+        self._bx = np.empty(0, dtype=np.float32)
+        self._by = np.empty(0, dtype=np.float32)
+        self._bspd = np.empty(0, dtype=np.float32)
+        self._bdrift = np.empty(0, dtype=np.float32)
+        self._brad = np.empty(0, dtype=np.int32)
+        self._bubble_sprites = make_bubble_sprites()
+        self._rng = np.random.default_rng()
         self.bubble_timer = 0
         self.running = True
 
@@ -228,6 +274,43 @@ class AquariumGame:
             for img in image_list:
                 self.add_fish(img)
 
+    def _get_background(self, index):
+        """Return background surface `index`, loading it on first use. # for other software engineers"""
+        surface = self._bg_cache.get(index)
+        if surface is not None:
+            self._bg_cache.move_to_end(index)
+            return surface
+
+        # convert() copies into the display's pixel format, so it needs set_mode() to have run
+        assert pygame.display.get_surface() is not None, "display must be set before loading backgrounds"
+        surface = pygame.transform.scale(
+            pygame.image.load(self._bg_paths[index]).convert(), (self.width, self.height)
+        )
+        self._bg_cache[index] = surface
+        if len(self._bg_cache) > BG_CACHE_SIZE:
+            self._bg_cache.popitem(last=False)
+        return surface
+
+    def add_bubbles(self, xs, ys, radii, speeds, drifts):
+        """Append new bubbles to the bubble arrays. # for other software engineers"""
+        self._bx = np.concatenate((self._bx, np.asarray(xs, dtype=np.float32)))
+        self._by = np.concatenate((self._by, np.asarray(ys, dtype=np.float32)))
+        self._brad = np.concatenate((self._brad, np.asarray(radii, dtype=np.int32)))
+        self._bspd = np.concatenate((self._bspd, np.asarray(speeds, dtype=np.float32)))
+        self._bdrift = np.concatenate((self._bdrift, np.asarray(drifts, dtype=np.float32)))
+
+    def _update_bubbles(self):
+        # for other software engineers: moves bubbles upwards with horizontal drift, drops those off screen
+        self._by -= self._bspd
+        self._bx += self._bdrift
+        keep = (self._by + self._brad > 0) & (self._bx > -50) & (self._bx < self.width + 50)
+        if not keep.all():
+            self._bx = self._bx[keep]
+            self._by = self._by[keep]
+            self._bspd = self._bspd[keep]
+            self._bdrift = self._bdrift[keep]
+            self._brad = self._brad[keep]
+
     def handle_events(self, selected_food_index):
         """Handle mouse and keyboard events. # for other software engineers"""
         for event in pygame.event.get():
@@ -238,9 +321,9 @@ class AquariumGame:
                 self.food_list.append(Food(event.pos, surface))
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RIGHT:
-                    self.current_bg_index = (self.current_bg_index + 1) % len(self.backgrounds)
+                    self.current_bg_index = (self.current_bg_index + 1) % len(self._bg_paths)
                 elif event.key == pygame.K_LEFT:
-                    self.current_bg_index = (self.current_bg_index - 1) % len(self.backgrounds)
+                    self.current_bg_index = (self.current_bg_index - 1) % len(self._bg_paths)
                 elif event.unicode.isdigit():
                     idx = int(event.unicode)
                     if 0 <= idx < len(self.food_surfaces):
@@ -250,26 +333,49 @@ class AquariumGame:
         """Update all game elements: fish, food, bubbles. # for other software engineers"""
         self.bubble_timer += 1
         if self.bubble_timer >= 12:
-            for _ in range(random.randint(1, 3)):
-                x = random.randint(20, self.width - 20)
-                y = self.height - 10
-                self.bubbles.append(Bubble(x, y))
+            # for other software engineers: one RNG call gives x, radius, speed and drift for every new bubble
+            n = int(self._rng.integers(1, 4))
+            u = self._rng.uniform(0, 1, size=(n, 4))
+            r_lo, r_hi = BUBBLE_RADIUS_RANGE
+            s_lo, s_hi = BUBBLE_SPEED_RANGE
+            d_lo, d_hi = BUBBLE_DRIFT_RANGE
+            self.add_bubbles(
+                np.floor(20 + u[:, 0] * (self.width - 39)),
+                np.full(n, self.height - 10),
+                np.floor(r_lo + u[:, 1] * (r_hi - r_lo + 1)),
+                s_lo + u[:, 2] * (s_hi - s_lo),
+                d_lo + u[:, 3] * (d_hi - d_lo),
+            )
             self.bubble_timer = 0
 
-        self.bubbles = [b for b in self.bubbles if b.update(self.width, self.height)]
+        self._update_bubbles()
         self.food_list = [f for f in self.food_list if f.update()]
-        for fish in self.fish_list:
-            fish.update(self.food_list)
+        self._food_xy = np.array(
+            [(f.x + f.hw, f.y + f.hh) for f in self.food_list], dtype=np.float32
+        ).reshape(-1, 2)
+        if cKDTree is not None and self.food_list and len(self.fish_list) >= KDTREE_MIN_FISH:
+            # for other software engineers: one query for all fish centers at once
+            centers = np.array([(f.x + f.hw, f.y + f.hh) for f in self.fish_list], dtype=np.float32)
+            dists, idxs = cKDTree(self._food_xy).query(centers)
+            for fish, dist, idx in zip(self.fish_list, dists, idxs):
+                fish.update(self.food_list, self._food_xy, (dist, idx))
+        else:
+            for fish in self.fish_list:
+                fish.update(self.food_list, self._food_xy)
 
     def draw(self):
         """Draw all game elements. # for client"""
-        if self.backgrounds:
-            self.screen.blit(self.backgrounds[self.current_bg_index], (0, 0))
+        if self._bg_paths:
+            self.screen.blit(self._get_background(self.current_bg_index), (0, 0))
         else:
             self.screen.fill((0, 100, 150))
 
-        for b in self.bubbles:
-            b.draw(self.screen)
+        # for client: draws bubbles as circles
+        sprites = self._bubble_sprites
+        for x, y, r in zip(self._bx.astype(np.int32).tolist(),
+                           self._by.astype(np.int32).tolist(),
+                           self._brad.tolist()):
+            self.screen.blit(sprites[r], (x - r, y - r))
         for f in self.food_list:
             f.draw(self.screen)
         for fish in self.fish_list:
@@ -288,14 +394,24 @@ class AquariumGame:
 
 
 # -------------------- Launcher --------------------
+def list_fish_images(fish_folder):
+    """Return the PNG paths in fish_folder, oldest first. # for other software engineers"""
+    # one scandir pass gives both names and ctimes, no extra stat per file
+    with os.scandir(fish_folder) as it:
+        # skip hidden files like macOS "._fish.png", as glob("*.png") did
+        entries = [
+            (e.path, e.stat().st_ctime) for e in it
+            if e.name.endswith(".png") and not e.name.startswith(".") and e.is_file()
+        ]
+    entries.sort(key=lambda t: t[1])
+    return [path for path, _ in entries]
+
+
 def aquarium(fish_images=None, fish_speeds=None,
              fish_folder="fish_drawings", bg_folder="tank", food_folder="food_images"):
     """Launcher function. # for client"""
     if fish_images is None:
-        fish_images = sorted(
-            [os.path.join(fish_folder, f) for f in os.listdir(fish_folder) if f.endswith(".png")],
-            key=os.path.getctime
-        )
+        fish_images = list_fish_images(fish_folder)
     if not fish_images:
         print("No fish drawn yet!")
         return
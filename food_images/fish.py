@@ -20,23 +20,29 @@ os.makedirs(output_folder, exist_ok=True)
 font_path = "/System/Library/Fonts/Apple Color Emoji.ttc"
 
 size = 256 
-max_font_size = 200 
+# Apple Color Emoji only has bitmap strikes at these sizes; other sizes fail to load
+font_sizes = [160, 96, 64, 48, 40, 32, 20]
 
-for key, emoji in emoji_dict.items():
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    font_size = max_font_size
-    while font_size > 10:
+def load_fitting_font(emoji, draw):
+    # largest font size that loads and fits the emoji inside the image
+    for font_size in font_sizes:
         try:
             font = ImageFont.truetype(font_path, font_size)
-            bbox = draw.textbbox((0, 0), emoji, font=font)
-            w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            if w <= size and h <= size:
-                break
         except OSError:
-            pass
-        font_size -= 2
+            continue
+        bbox = draw.textbbox((0, 0), emoji, font=font)
+        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        if w <= size and h <= size:
+            return font
+    raise OSError(f"No usable font size for {emoji} in {font_path}")
+
+
+for key, emoji in emoji_dict.items():
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    font = load_fitting_font(emoji, draw)
 
     bbox = draw.textbbox((0, 0), emoji, font=font)
     w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
@@ -46,5 +52,6 @@ for key, emoji in emoji_dict.items():
     draw.text((x, y), emoji, font=font, embedded_color=True)
 
     output_path = os.path.join(output_folder, f"{key}_{emoji}.png")
-    img.save(output_path)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        img.save(f, format="PNG")
     print(f"Saved {output_path}")
@@ -1,5 +1,4 @@
 import os
-import glob
 from tkinter import simpledialog, messagebox
 
 import drawing_interface
@@ -11,7 +10,6 @@ def main():
     """ Folder setup """
     FISH_FOLDER = "fish_drawings"
     BG_FOLDER = "tank"
-    os.makedirs(FISH_FOLDER, exist_ok=True)
     os.makedirs(BG_FOLDER, exist_ok=True)
 
     """ Step 1: Draw fish """
@@ -39,10 +37,7 @@ def main():
     )
 
     """ Step 4: Load all historical fish """
-    all_fish = sorted(
-        [os.path.abspath(p) for p in glob.glob(os.path.join(FISH_FOLDER, "*.png"))],
-        key=os.path.getctime
-    )
+    all_fish = [os.path.abspath(p) for p in fishtank.list_fish_images(FISH_FOLDER)]
     latest_abs = os.path.abspath(latest_path)
 
     # Remove duplicate if exists